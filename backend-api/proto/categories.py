@@ -0,0 +1,201 @@
+# categories.py
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional
+
+from util import BASKETBALL_POS
+
+# Category order matches calculateCategoryScores() in scripts/basketball/basketball_scoring.ts
+CATEGORIES_9 = [
+    "points", "rebounds", "assists", "steals", "blocks", "turnovers",
+    "field_goal_percentage", "free_throw_percentage", "three_pointers_made",
+]
+CATEGORIES_8 = [c for c in CATEGORIES_9 if c != "turnovers"]
+
+# counting cats: column in the projections CSV
+COUNTING_COLS = {
+    "points": "projected_points",
+    "rebounds": "projected_rebounds",
+    "assists": "projected_assists",
+    "steals": "projected_steals",
+    "blocks": "projected_blocks",
+    "turnovers": "projected_turnovers",
+    "three_pointers_made": "projected_three_pointers_made",
+}
+# percentage cats: (made, attempted) -> valued by volume-weighted impact, not raw %
+PERCENT_COLS = {
+    "field_goal_percentage": ("projected_field_goals_made", "projected_field_goals_attempted"),
+    "free_throw_percentage": ("projected_free_throws_made", "projected_free_throws_attempted"),
+}
+NEGATIVE_CATS = {"turnovers"}
+
+# ESPN defaultPositionId -> position (same map as scrape_espn_basketball_projections.ts)
+NBA_POSITION_MAP = {1: "PG", 2: "SG", 3: "SF", 4: "PF", 5: "C"}
+DEFAULT_GAMES = 82  # missing/zero projected_games, same default as upload_basketball_to_supabase.ts
+
+
+def _per_game(df: pd.DataFrame, col: str) -> np.ndarray:
+    """
+    Season totals -> per-game (the upload script treats projected_* as totals).
+    The scraper writes null games when ESPN omits stat 13; those rows use DEFAULT_GAMES
+    rather than zeroing every stat.
+    """
+    tot = df[col].fillna(0.0).to_numpy(dtype=float) if col in df else np.zeros(len(df))
+    if 'projected_games' not in df:
+        return tot
+    games = pd.to_numeric(df['projected_games'], errors='coerce').to_numpy(dtype=float)
+    games = np.where(np.isnan(games) | (games <= 0), DEFAULT_GAMES, games)
+    return tot / games
+
+
+def category_matrix(df: pd.DataFrame, categories: List[str] = CATEGORIES_9):
+    """
+    Build the raw per-game stat matrix X (n_players x n_cats) plus the made/attempted
+    matrices needed for the percentage categories.
+    Returns: (X, made, att) where made/att are (n_players x n_cats), zero for counting cats.
+    """
+    n, k = len(df), len(categories)
+    X = np.zeros((n, k))
+    made = np.zeros((n, k))
+    att = np.zeros((n, k))
+    for j, cat in enumerate(categories):
+        if cat in COUNTING_COLS:
+            X[:, j] = _per_game(df, COUNTING_COLS[cat])
+        elif cat in PERCENT_COLS:
+            m_col, a_col = PERCENT_COLS[cat]
+            made[:, j] = _per_game(df, m_col)
+            att[:, j] = _per_game(df, a_col)
+        else:
+            raise ValueError(f"Unknown category: {cat}")
+    return X, made, att
+
+
+def category_zscores(
+    X: np.ndarray,
+    made: np.ndarray,
+    att: np.ndarray,
+    categories: List[str],
+    pool_size: int,
+    passes: int = 2,
+) -> np.ndarray:
+    """
+    Vectorized z-scores for the whole pool (n_players x n_cats).
+      - counting cats: z = (x - mu) / sd
+      - percentage cats: impact = att * (pct - pool_pct), then z over impact
+      - negative cats (turnovers) flipped so higher is always better
+    mu/sd are taken over the top `pool_size` players (the draftable pool), re-ranked
+    `passes` times so the reference pool is chosen by the z-scores themselves.
+    """
+    is_pct = np.array([c in PERCENT_COLS for c in categories])
+    sign = np.array([-1.0 if c in NEGATIVE_CATS else 1.0 for c in categories])
+    ref = np.ones(len(X), dtype=bool)  # first pass: everyone
+
+    for _ in range(max(1, passes)):
+        # pool-wide shooting % per category from the reference pool
+        pool_pct = made[ref].sum(axis=0) / np.maximum(att[ref].sum(axis=0), 1e-9)
+        pct = np.divide(made, att, out=np.zeros_like(made), where=att > 0)
+        S = np.where(is_pct, att * (pct - pool_pct), X)
+
+        mu = S[ref].mean(axis=0)
+        sd = S[ref].std(axis=0)
+        sd[sd <= 0] = 1.0
+        Z = sign * (S - mu) / sd
+
+        # next reference pool: top pool_size by unweighted total
+        top = np.argsort(-Z.sum(axis=1), kind='stable')[:pool_size]
+        ref = np.zeros(len(X), dtype=bool)
+        ref[top] = True
+    return Z
+
+
+def punt_weights(categories: List[str], punt: Iterable[str] = (), weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    Category weight vector: 1.0 by default, 0.0 for punted cats, overridden by `weights`.
+    Example: punt_weights(CATEGORIES_9, punt=['field_goal_percentage','turnovers'])
+    """
+    punt = set(punt)
+    unknown = (punt | set(weights or {})) - set(categories)
+    if unknown:
+        raise ValueError(f"Unknown categories in punt/weights: {unknown}")
+    w = np.array([0.0 if c in punt else 1.0 for c in categories])
+    for c, v in (weights or {}).items():
+        w[categories.index(c)] = float(v)
+    return w
+
+
+def _eligibility(df: pd.DataFrame) -> pd.Series:
+    """'PG/SG'-style eligibility strings from eligible_positions / position / position_id."""
+    if 'eligible_positions' in df:
+        raw = df['eligible_positions'].astype(str)
+    elif 'position' in df:
+        raw = df['position'].astype(str)
+    else:
+        raw = df['position_id'].map(NBA_POSITION_MAP).fillna('')
+    def clean(s):
+        ps = [p for p in s.upper().replace(',', '/').replace(' ', '').split('/') if p in BASKETBALL_POS]
+        return '/'.join(sorted(set(ps), key=['PG', 'SG', 'SF', 'PF', 'C'].index))
+    return raw.map(clean)
+
+
+def load_basketball_players(
+    csv_path: str,
+    n_teams: int = 12,
+    rounds: int = 13,
+    categories: List[str] = CATEGORIES_9,
+    punt: Iterable[str] = (),
+    weights: Optional[Dict[str, float]] = None,
+) -> pd.DataFrame:
+    """
+    Load NBA projections (scrape_espn_basketball_projections.ts CSV or a player_name/position CSV)
+    into the same frame shape util.load_players() returns, so demand.py/var.py run unchanged:
+      - 'position'  : primary position (first eligible)
+      - 'eligible'  : multi-eligibility string, e.g. 'PG/SG' (used by Team.can_draft)
+      - 'z_<cat>'   : per-category z-scores
+      - 'ppg'       : weighted z total (the category "value"; kept under 'ppg' for var.py)
+    """
+    df = pd.read_csv(csv_path)
+    if 'player_name' not in df and 'full_name' in df:
+        df['player_name'] = df['full_name']
+    df['eligible'] = _eligibility(df)
+    df = df[df['eligible'] != ''].copy()
+    df.reset_index(drop=True, inplace=True)
+    df['position'] = df['eligible'].str.split('/').str[0]
+
+    X, made, att = category_matrix(df, categories)
+    Z = category_zscores(X, made, att, categories, pool_size=n_teams * rounds)
+    w = punt_weights(categories, punt, weights)
+
+    for j, cat in enumerate(categories):
+        df[f'z_{cat}'] = Z[:, j]
+    df['ppg'] = Z @ w
+
+    # global rank by ADP if present; else by -value
+    if 'adp' in df and df['adp'].notna().any():
+        df['global_rank'] = df['adp'].rank(method='min')
+    else:
+        df['global_rank'] = (-df['ppg']).rank(method='min')
+    # stable ordering
+    df.sort_values(['position','ppg','global_rank'], ascending=[True,False,True], inplace=True)
+    df.reset_index(drop=True, inplace=True)
+    return df
+
+
+
+if __name__ == "__main__":
+    # python categories.py <nba_projections.csv>
+    # Check: rows with null projected_games keep the value their totals imply (totals over
+    # DEFAULT_GAMES) instead of falling to the bottom of the pool.
+    import os, sys, tempfile
+    raw = pd.read_csv(sys.argv[1])
+    rows = raw.index[:10]
+    with tempfile.TemporaryDirectory() as d:
+        paths = []
+        for games in (DEFAULT_GAMES, np.nan):
+            raw.loc[rows, 'projected_games'] = games
+            paths.append(os.path.join(d, f'{len(paths)}.csv'))
+            raw.to_csv(paths[-1], index=False)
+        explicit, null = (load_basketball_players(p).set_index('player_name')['ppg'] for p in paths)
+    names = raw.loc[rows, 'player_name' if 'player_name' in raw else 'full_name']
+    diff = float((explicit.loc[names] - null.loc[names]).abs().max())
+    print(f"[categories] null-games check: max |ppg diff| = {diff:.2e} over {len(names)} rows")
+    assert diff < 1e-9, "null projected_games changed player values"
@@ -11,6 +11,20 @@ def _ensure_espn_rank(df):
         return 'espn_rank'
     return 'global_rank'  # created in util.load_players()
 
+def roster_pos(df, ix) -> str:
+    """Position string Team.can_draft() expects: multi-eligibility ('PG/SG') if present, else position."""
+    if 'eligible' in df.columns:
+        return df.at[ix, 'eligible']
+    return df.at[ix, 'position']
+
+def _board_frame(df, available_ix):
+    """
+    Narrow frame of available players with only the columns the hazard reads.
+    Built once per forecast so each step slices a few columns instead of the full df.
+    """
+    cols = [c for c in ('espn_rank', 'global_rank', 'adp_velocity', 'position', 'eligible') if c in df.columns]
+    return df.loc[list(available_ix), cols]
+
 def _normalize(d: Dict[int, float]) -> Dict[int, float]:
     s = float(sum(v for v in d.values() if v > 0))
     if s <= 0:
@@ -27,7 +41,11 @@ def esbn_pick_probs_for_team(
     eta: float = 0.4,          # sharpness for top-N
     tail_k: int = 5,           # how many "just off screen" players to consider
     tail_w: float = 0.10,      # % of attention mass reserved for the tail
-    eta_tail: float = 0.10     # gentler decay for tail
+    eta_tail: float = 0.10,    # gentler decay for tail
+    momentum_days: float = 0.0,# shift ranks by adp_velocity * days (see snapshots.attach_adp_momentum_inplace)
+    mix: float = 0.0,          # ADP-vs-ESPN blend: 0 = ESPN board, 1 = global_rank (ADP)
+    pos_bias: Dict[str, float] = None, # per-position log-weight added to scores (opponents.OpponentModel)
+    board=None                 # precomputed _board_frame(df, available_ix), shared across forecast steps
 ) -> Dict[int, float]:
     """
     Player-level hazard for ONE upcoming pick:
@@ -35,62 +53,88 @@ def esbn_pick_probs_for_team(
       - Softmax over (-eta * rank) for the main window
       - Add a small "leaky tail" (tail_k) just beyond N with mass tail_w
       - Zero out players the team cannot draft; renormalize
+    With momentum_days > 0 and df['adp_velocity'] present, each rank is projected that many
+    days ahead along its ADP trend, so risers are taken earlier and fallers later.
+    mix / pos_bias (and eta) come from opponents.OpponentModel.params() for team-specific hazards;
+    the defaults reproduce the shared ESPN model.
     """
     rank_col = _ensure_espn_rank(df)
-    avail = df.loc[list(available_ix)]
+    if board is None:
+        board = _board_frame(df, available_ix)
+    idx = board.index.to_numpy()
+    rank = board[rank_col].to_numpy(dtype=float)
+    if mix > 0 and rank_col != 'global_rank':
+        rank = (1.0 - mix) * rank + mix * board['global_rank'].to_numpy(dtype=float)
+    if momentum_days and 'adp_velocity' in board.columns:
+        rank = rank + momentum_days * board['adp_velocity'].fillna(0.0).to_numpy(dtype=float)
+    bias = None
+    if pos_bias:
+        bias = np.fromiter((pos_bias.get(p, 0.0) for p in board['position'].to_numpy()), dtype=float, count=len(board))
+
+    # legality once per distinct roster key (position or 'PG/SG'-style eligibility)
+    keys = board['eligible' if 'eligible' in board.columns else 'position'].to_numpy()
+    legal_by_key = {k: team.can_draft(k) for k in set(keys)}
+    legal = np.fromiter((legal_by_key[k] for k in keys), dtype=bool, count=len(keys))
+
+    # board order by rank (stable, NaN ranks dropped — same as Series.nsmallest)
+    order = np.argsort(rank, kind='stable')
+    order = order[~np.isnan(rank[order])]
 
     # progressively widen the main window if necessary
-    for window in (N, max(N, 15), max(N, 25), len(avail)):
-        topN = avail.nsmallest(window, rank_col)
+    for window in (N, max(N, 15), max(N, 25), len(idx)):
+        top = order[:window]
 
         # --- main window softmax (top-N) ---
-        top_scores = -eta * topN[rank_col].values
+        top_scores = -eta * rank[top]
+        if bias is not None:
+            top_scores = top_scores + bias[top]
         top_scores -= top_scores.max()  # numerical stability
         top_weights = np.exp(top_scores)
-        probs_top = dict(zip(topN.index.to_list(), (top_weights / top_weights.sum()).tolist()))
+        top_weights = top_weights / top_weights.sum()
 
         # --- leaky tail just outside top-N ---
-        tail_pool = avail.loc[~avail.index.isin(topN.index)].nsmallest(tail_k, rank_col)
-        if len(tail_pool) > 0 and tail_w > 0:
-            tail_scores = -eta_tail * tail_pool[rank_col].values
+        tail = order[window:window + tail_k]
+        if len(tail) > 0 and tail_w > 0:
+            tail_scores = -eta_tail * rank[tail]
+            if bias is not None:
+                tail_scores = tail_scores + bias[tail]
             tail_scores -= tail_scores.max()
             tail_weights = np.exp(tail_scores)
             tail_weights = tail_weights / tail_weights.sum()
 
             # scale masses: (1 - tail_w) for top, tail_w for tail
-            probs_top = {ix: (1.0 - tail_w) * w for ix, w in probs_top.items()}
-            probs_tail = dict(zip(tail_pool.index.to_list(), (tail_w * tail_weights).tolist()))
-            probs = {**probs_top, **probs_tail}
+            pool = np.concatenate([top, tail])
+            w = np.concatenate([(1.0 - tail_w) * top_weights, tail_w * tail_weights])
         else:
-            probs = probs_top
+            pool, w = top, top_weights
 
         # --- roster need filter, then renormalize ---
-        any_allowed = False
-        for ix in list(probs.keys()):
-            pos = df.loc[ix, 'position']
-            if not team.can_draft(pos):
-                probs[ix] = 0.0
-            else:
-                any_allowed = True
-
-        if any_allowed and sum(probs.values()) > 0:
-            return _normalize(probs)
+        w = np.where(legal[pool], w, 0.0)
+        if legal[pool].any() and w.sum() > 0:
+            return _normalize(dict(zip(idx[pool].tolist(), w.tolist())))
 
     # Final fallback: best-ranked legal
-    for ix in avail.sort_values(rank_col).index:
-        if team.can_draft(df.loc[ix, 'position']):
-            return {ix: 1.0}
+    for i in np.concatenate([order, np.flatnonzero(np.isnan(rank))]):
+        if legal[i]:
+            return {idx[i].item(): 1.0}
     return {}
 
 
-def multi_pick_player_hazards(df, draft, available_ix, horizon, N=10, eta=0.4):
+def multi_pick_player_hazards(df, draft, available_ix, horizon, N=10, eta=0.4, momentum_days=0.0, opponents=None):
+    """
+    One hazard dict per upcoming pick. With `opponents` (OpponentModel) each pick uses its
+    owner's learned (eta, mix, pos_bias); `eta` is then ignored (the model's prior replaces it).
+    """
+    board = _board_frame(df, available_ix)
     hazards = []
     for step in range(horizon):
         owner = draft.pick_owner(draft.current_pick + step)
         team = draft.teams[owner]
         # grow the visible window a bit the farther out we are
         N_step = N + max(0, step // 6)  # +1 every ~6 picks
-        probs = esbn_pick_probs_for_team(df, available_ix, team, N=N_step, eta=eta)
+        eta_t, mix_t, bias_t = opponents.params(owner) if opponents is not None else (eta, 0.0, None)
+        probs = esbn_pick_probs_for_team(df, available_ix, team, N=N_step, eta=eta_t,
+                                         momentum_days=momentum_days, mix=mix_t, pos_bias=bias_t, board=board)
         hazards.append(probs)
     return hazards
 
@@ -102,11 +146,11 @@ def expected_position_drain_from_hazards(hazards: List[Dict[int, float]], df) ->
     Sum probability mass by position across the upcoming picks.
     Returns: E[K_pos] for each position.
     """
+    ixs = [ix for pick_probs in hazards for ix in pick_probs]
+    ps = [p for pick_probs in hazards for p in pick_probs.values()]
     E = defaultdict(float)
-    for pick_probs in hazards:
-        for ix, p in pick_probs.items():
-            pos = df.loc[ix, 'position']
-            E[pos] += p
+    for pos, p in zip(df.loc[ixs, 'position'].to_numpy(), ps):  # one lookup, not one per entry
+        E[pos] += p
     return dict(E)
 
 # ========== Player survival probabilities ==========
@@ -124,11 +168,13 @@ def survival_probs(hazards: List[Dict[int, float]], player_ixs: Iterable[int]) -
 
 # ========== Convenience: one-shot forecast package ==========
 
-def forecast_until_next_pick_esbn(df, draft, available_ix: Iterable[int], horizon: int, N: int = 10, eta: float = 0.4):
+def forecast_until_next_pick_esbn(df, draft, available_ix: Iterable[int], horizon: int, N: int = 10, eta: float = 0.4,
+                                  momentum_days: float = 0.0, opponents=None):
     """
     Bundle: hazards list + positional drains E[K_pos].
     """
-    hazards = multi_pick_player_hazards(df, draft, available_ix, horizon, N=N, eta=eta)
+    hazards = multi_pick_player_hazards(df, draft, available_ix, horizon, N=N, eta=eta,
+                                        momentum_days=momentum_days, opponents=opponents)
     E_drain = expected_position_drain_from_hazards(hazards, df)
     return hazards, E_drain
 
@@ -141,17 +187,17 @@ def autopick_index_from_hazard(hazard_for_current_pick: Dict[int, float], df, te
     """
     if hazard_for_current_pick:
         # Keep only legal
-        legal = [(ix, p) for ix, p in hazard_for_current_pick.items() if team.can_draft(df.loc[ix,'position'])]
+        legal = [(ix, p) for ix, p in hazard_for_current_pick.items() if team.can_draft(roster_pos(df, ix))]
         if legal:
             return max(legal, key=lambda kv: kv[1])[0]
     # Fallback: best ranked legal
     rank_col = _ensure_espn_rank(df)
     for ix in df.sort_values(rank_col).index:
         if ix in hazard_for_current_pick:  # keep pool tight if possible
-            if team.can_draft(df.loc[ix,'position']):
+            if team.can_draft(roster_pos(df, ix)):
                 return ix
     # As last resort scan all
     for ix in df.sort_values(rank_col).index:
-        if team.can_draft(df.loc[ix,'position']):
+        if team.can_draft(roster_pos(df, ix)):
             return ix
     raise RuntimeError("No legal pick available (roster config error?)")
@@ -1,16 +1,20 @@
 # draft.py
-import sys, readline
+import os, sys, readline
 import pandas as pd
 from tabulate import tabulate
 from util import load_players, positional_lists, load_espn_ranks, attach_espn_ranks_inplace, report_espn_match_coverage
-from models import DraftState, LINEUP
+from models import DraftState, LINEUP, BASKETBALL_LINEUP, BASKETBALL_SLOTS
+from categories import load_basketball_players
+from snapshots import SnapshotStore, attach_adp_momentum_inplace
+from opponents import OpponentModel, board_depths
 
 
 from demand import (
     forecast_until_next_pick_esbn,
     survival_probs,
     autopick_index_from_hazard,
-    esbn_pick_probs_for_team  # add to your imports
+    esbn_pick_probs_for_team,  # add to your imports
+    roster_pos
 )
 from var import expected_best_next, current_best_now, davar_esbn, league_replacement_indices, replacement_ppg_by_pos
 from util import positional_lists
@@ -35,16 +39,19 @@ def current_espn_board_positions(df, available_ix):
 def available_indices(df, taken):
     return [i for i in df.index if i not in taken]
 
-def predict_current_pick(df, draft, N_window=10, eta=0.4):
+def predict_current_pick(df, draft, N_window=10, eta=0.4, momentum_days=0.0, opponents=None):
     """
     Predict the player the CURRENT team (draft.current_pick owner) will take,
     using the ESPN hazard for THIS pick only.
+    With `opponents`, the owner's learned eta replaces `eta` (ignored in that case).
     Returns: (pred_ix, hazard_current_dict)
     """
     owner = draft.pick_owner(draft.current_pick)
     team = draft.teams[owner]
     avail_ix = available_indices(df, draft.taken)
-    hazard = esbn_pick_probs_for_team(df, avail_ix, team, N=N_window, eta=eta)
+    eta_t, mix_t, bias_t = opponents.params(owner) if opponents is not None else (eta, 0.0, None)
+    hazard = esbn_pick_probs_for_team(df, avail_ix, team, N=N_window, eta=eta_t,
+                                      momentum_days=momentum_days, mix=mix_t, pos_bias=bias_t)
     if not hazard:
         return None, {}
     pred_ix = max(hazard.items(), key=lambda kv: kv[1])[0]
@@ -52,6 +59,16 @@ def predict_current_pick(df, draft, N_window=10, eta=0.4):
 
 
 
+def _assign_slots_lineup(df, team):
+    """
+    Slot-eligibility rosters (basketball): show the matching Team.can_draft() found,
+    in lineup order (PG, SG, ..., UTIL, BENCH).
+    """
+    rows = []
+    for slot, ix in team.slot_assignment():
+        rows.append([slot, df.loc[ix, 'player_name'], roster_pos(df, ix), round(float(df.loc[ix, 'ppg']), 2)])
+    return rows
+
 def _assign_user_lineup(df, team):
     """
     Greedy, best-ball style assignment for DISPLAY ONLY:
@@ -102,16 +119,16 @@ def _assign_user_lineup(df, team):
 
 def print_user_roster(df, draft):
     team = draft.teams[draft.user_team_ix]
-    rows = _assign_user_lineup(df, team)
+    rows = _assign_slots_lineup(df, team) if team.slots is not None else _assign_user_lineup(df, team)
     counts = []
-    for pos in ['QB', 'RB', 'WR', 'TE', 'FLEX']:
-        filled = LINEUP.get(pos, 0) - team.need.get(pos, 0)
+    for pos in draft.lineup:
+        filled = draft.lineup.get(pos, 0) - team.need.get(pos, 0)
         remaining = team.need.get(pos, 0)
         counts.append([pos, max(filled, 0), max(remaining, 0)])
 
     print("\n-- Your roster so far --")
     if rows:
-        print(tabulate(rows, headers=["Slot", "Player", "Pos", "PPG"], tablefmt="github"))
+        print(tabulate(rows, headers=["Slot", "Player", "Pos", "Value" if team.slots is not None else "PPG"], tablefmt="github"))
     else:
         print("(no picks yet)")
     print(tabulate(counts, headers=["Slot", "Filled", "Remaining"], tablefmt="github"))
@@ -133,7 +150,8 @@ def steps_until_user_next_pick(draft):
         steps += 1
     return steps
 
-def show_recs(df, draft, topN=12, N_window=10, eta=0.4, alpha=0.9, beta=0.6):
+def show_recs(df, draft, topN=12, N_window=10, eta=0.4, alpha=0.9, beta=0.6, momentum_days=0.0, opponents=None):
+    # NOTE: with `opponents`, each team's learned eta replaces `eta` in the hazards
     # horizon until user's next pick
     h = steps_until_user_next_pick(draft)
     avail_ix = available_indices(df, draft.taken)
@@ -141,7 +159,8 @@ def show_recs(df, draft, topN=12, N_window=10, eta=0.4, alpha=0.9, beta=0.6):
 
 
     # ESPN-based hazards & drains
-    hazards, E_drain = forecast_until_next_pick_esbn(df, draft, avail_ix, h, N=N_window, eta=eta)
+    hazards, E_drain = forecast_until_next_pick_esbn(df, draft, avail_ix, h, N=N_window, eta=eta,
+                                                     momentum_days=momentum_days, opponents=opponents)
 
     print(f"Horizon to your next pick (H) = {h}, sum(E[K_pos]) = {round(sum(E_drain.values()),2)}")
     
@@ -154,11 +173,13 @@ def show_recs(df, draft, topN=12, N_window=10, eta=0.4, alpha=0.9, beta=0.6):
 
     # Best-now and expected-best-next by position
     best_now = current_best_now(df, pos_lists, avail_ix)
-    E_best_next = expected_best_next(df, pos_lists, avail_ix, E_drain)
+    # category values are z-totals centred on 0, so an exhausted position floors at 0 rather than football PPG
+    floor = {} if draft.slots is None else {'floor_ppg': 0.0}
+    E_best_next = expected_best_next(df, pos_lists, avail_ix, E_drain, **floor)
 
     # Replacement indices
-    repl_idx_map = league_replacement_indices(draft.n_teams, LINEUP)
-    repl_ppg = replacement_ppg_by_pos(df, pos_lists, avail_ix, repl_idx_map)
+    repl_idx_map = league_replacement_indices(draft.n_teams, draft.lineup, draft.slots)
+    repl_ppg = replacement_ppg_by_pos(df, pos_lists, avail_ix, repl_idx_map, **floor)
 
     # Build table
     rows = []
@@ -172,7 +193,7 @@ def show_recs(df, draft, topN=12, N_window=10, eta=0.4, alpha=0.9, beta=0.6):
         
         rows.append([
             r['player_name'],
-            r['position'],
+            roster_pos(df, ix),
             board_pos_map.get(ix, None),                       # <-- NEW: current ESPN board #
             round(float(r['ppg']), 2),
             f"{100*surv.get(ix,1.0):.0f}%",
@@ -194,7 +215,8 @@ def show_recs(df, draft, topN=12, N_window=10, eta=0.4, alpha=0.9, beta=0.6):
     print("\nPos drain by your next pick (E[K_pos]):", {k: round(v,2) for k,v in E_drain.items()})
 
     owner_now = draft.pick_owner(draft.current_pick)
-    pred_ix, hazard_current = predict_current_pick(df, draft, N_window=N_window, eta=eta)
+    pred_ix, hazard_current = predict_current_pick(df, draft, N_window=N_window, eta=eta,
+                                                   momentum_days=momentum_days, opponents=opponents)
     if pred_ix is not None:
         p = df.loc[pred_ix]
         prob = hazard_current.get(pred_ix, 0.0)
@@ -215,6 +237,14 @@ DATA = "/Users/beaubruneau/dev/side_projects/sacco-mono/backend-api/proto/data/p
 ESPN = "/Users/beaubruneau/dev/side_projects/sacco-mono/backend-api/proto/data/espn_rankings_final.csv"
 N_TEAMS, ROUNDS, USER_TEAM = 12, 15, 4  # user is team 0 (change as needed)
 
+# Basketball category league: `python draft.py basketball [punt_cat ...]`
+NBA_DATA = "/Users/beaubruneau/dev/side_projects/sacco-mono/backend-api/proto/data/nba_projections.csv"
+NBA_TEAMS, NBA_ROUNDS = 12, 13
+
+# ADP snapshot history (append refreshes with `python snapshots.py <dir> <rankings.csv>`)
+SNAPSHOTS = "/Users/beaubruneau/dev/side_projects/sacco-mono/backend-api/proto/data/snapshots"
+MOMENTUM_DAYS = 3.0  # project each board rank this many days along its ADP trend
+
 def available_indices(df, taken):
     return [i for i in df.index if i not in taken]
 
@@ -223,17 +253,40 @@ def find_player(df, query):
     return list(cand.index)
 
 def main():
-    df = load_players(DATA)
-
-    # Attach ESPN ranks (creates df['espn_rank'])
-    try:
-        espn = load_espn_ranks(ESPN)
-        attach_espn_ranks_inplace(df, espn)
-        report_espn_match_coverage(df)
-    except Exception as e:
-        print(f"[ESPN merge] Warning: {e} — falling back to global_rank for hazards.")
-
-    draft = DraftState(n_teams=N_TEAMS, rounds=ROUNDS, user_team_ix=USER_TEAM)
+    basketball = len(sys.argv) > 1 and sys.argv[1].lower() == 'basketball'
+    if basketball:
+        punt = sys.argv[2:]
+        df = load_basketball_players(NBA_DATA, n_teams=NBA_TEAMS, rounds=NBA_ROUNDS, punt=punt)
+        draft = DraftState(n_teams=NBA_TEAMS, rounds=NBA_ROUNDS, user_team_ix=USER_TEAM,
+                           lineup=dict(BASKETBALL_LINEUP), slots=BASKETBALL_SLOTS)
+        if punt:
+            print(f"[Categories] punting: {', '.join(punt)}")
+    else:
+        df = load_players(DATA)
+        draft = DraftState(n_teams=N_TEAMS, rounds=ROUNDS, user_team_ix=USER_TEAM)
+
+    # Attach ESPN ranks (creates df['espn_rank']); the ESPN board on disk is football-only
+    if not basketball:
+        try:
+            espn = load_espn_ranks(ESPN)
+            attach_espn_ranks_inplace(df, espn)
+            report_espn_match_coverage(df)
+        except Exception as e:
+            print(f"[ESPN merge] Warning: {e} — falling back to global_rank for hazards.")
+
+    # Per-team pick behaviour, learned as picks come in. Its prior eta (softmax sharpness toward
+    # the top of the board) is the only eta the hazards use, so show_recs/predict get none.
+    opponents = OpponentModel(draft.n_teams, sorted(df['position'].unique()), eta=0.8)
+
+    # ADP momentum from the snapshot store (no history → no momentum); the store is football-only
+    momentum_days = 0.0
+    if not basketball and os.path.isdir(SNAPSHOTS):
+        store = SnapshotStore(SNAPSHOTS)
+        matched = attach_adp_momentum_inplace(df, store)  # players with >= 2 snapshots in the window
+        if matched:
+            momentum_days = MOMENTUM_DAYS
+            print(f"[Snapshots] ADP momentum for {matched}/{len(df)} players from "
+                  f"{len(store.timestamps())} snapshots ({MOMENTUM_DAYS:g} days ahead).")
 
     while not draft.is_complete():
         owner = draft.pick_owner(draft.current_pick)
@@ -247,9 +300,10 @@ def main():
             df, draft,
             topN=24,         # how many rows to display
             N_window=24,     # ESPN top-N window for attention
-            eta=0.8,         # softmax sharpness toward top of board
             alpha=0.9,       # DAVAR weight on pos-wait cost
-            beta=0.6         # DAVAR cross-pos hedge weight
+            beta=0.6,        # DAVAR cross-pos hedge weight
+            momentum_days=momentum_days,
+            opponents=opponents
         )
 
         print(f"\nPick {draft.current_pick} is Team {owner}.")
@@ -257,7 +311,8 @@ def main():
 
         if cmd.lower() == 'auto':
             if pred_ix is None:
-                pred_ix, _ = predict_current_pick(df, draft, N_window=20, eta=0.7)
+                pred_ix, _ = predict_current_pick(df, draft, N_window=20,
+                                                  momentum_days=momentum_days, opponents=opponents)
             pick_ix = pred_ix
             
         elif cmd.isdigit():
@@ -271,16 +326,20 @@ def main():
             pick_ix = df.loc[matches].sort_values('ppg', ascending=False).index[0]
 
         # Validate roster need
-        pos = df.loc[pick_ix, 'position']
+        pos = roster_pos(df, pick_ix)
         if not draft.teams[owner].can_draft(pos):
             print(f"Team {owner} cannot draft {pos} (slots full). Try another pick.")
             continue
 
+        # Online update of the owner's behaviour model: board and open slots as they were when picking
+        # (before taken/add_player), so forced positional picks don't count as reaches
+        espn_depth, adp_depth = board_depths(df, available_indices(df, draft.taken), pick_ix, team=draft.teams[owner])
+        opponents.observe(owner, df.loc[pick_ix, 'position'], espn_depth, adp_depth)
+
         # Apply pick
         draft.taken.add(pick_ix)
         draft.teams[owner].picks.append(pick_ix)
         draft.teams[owner].add_player(pos)
-        # NOTE: No Dirichlet/Bayesian update needed in ESPN hazard model.
 
         # Advance
         draft.current_pick += 1
@@ -1,25 +1,96 @@
 # models.py
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import math
 
 POSITIONS = ["RB","WR","QB","TE"]  # order just for display
 LINEUP = {"QB":1, "RB":2, "WR":2, "TE":1, "FLEX":1}
 FLEX_SET = {"RB","WR","TE"}
 
+# Basketball (category leagues): slot -> eligible positions; players can be multi-eligible ("PG/SG")
+BASKETBALL_POSITIONS = ["PG","SG","SF","PF","C"]
+BASKETBALL_LINEUP = {"PG":1, "SG":1, "SF":1, "PF":1, "C":1, "G":1, "F":1, "UTIL":3, "BENCH":3}  # 13 rounds
+BASKETBALL_SLOTS = {
+    "PG": {"PG"}, "SG": {"SG"}, "SF": {"SF"}, "PF": {"PF"}, "C": {"C"},
+    "G": {"PG","SG"}, "F": {"SF","PF"},
+    "UTIL": set(BASKETBALL_POSITIONS), "BENCH": set(BASKETBALL_POSITIONS),
+}
+
+def _elig(pos: str) -> frozenset:
+    """'PG/SG' -> {'PG','SG'}"""
+    return frozenset(p for p in str(pos).split('/') if p)
+
 @dataclass
 class Team:
     picks: List[int] = field(default_factory=list)        # indices into DF
     need: Dict[str,int] = field(default_factory=lambda: dict(LINEUP))
+    slots: Optional[Dict[str,set]] = None                   # None = football QB/RB/WR/TE/FLEX rules
+    held: List[frozenset] = field(default_factory=list)    # eligibility of each drafted player (slots mode)
+    _legal: Dict[str,bool] = field(default_factory=dict, repr=False)  # can_draft cache, reset on add
+
+    def __post_init__(self):
+        # one entry per physical slot, in lineup order (dedicated slots first, then G/F, UTIL, BENCH)
+        self._slot_names = [s for s, n in self.need.items() for _ in range(n)]
+        self._lineup = dict(self.need)
+
+    def _match(self, players: List[frozenset]) -> Optional[List[int]]:
+        """
+        Bipartite matching players -> slots (augmenting paths; rosters are ~13 so this is cheap).
+        Returns slot index per player, or None if the roster is illegal.
+        """
+        slot_elig = [self.slots[s] for s in self._slot_names]
+        owner = [-1] * len(slot_elig)
+
+        def augment(p, seen):
+            for s, ok in enumerate(slot_elig):
+                if s in seen or not (players[p] & ok):
+                    continue
+                seen.add(s)
+                if owner[s] == -1 or augment(owner[s], seen):
+                    owner[s] = p
+                    return True
+            return False
+
+        for p in range(len(players)):
+            if not augment(p, set()):
+                return None
+        out = [0] * len(players)
+        for s, p in enumerate(owner):
+            if p != -1:
+                out[p] = s
+        return out
 
     def can_draft(self, pos: str) -> bool:
+        if self.slots is not None:
+            if pos not in self._legal:
+                self._legal[pos] = self._match(self.held + [_elig(pos)]) is not None
+            return self._legal[pos]
         if pos in self.need and self.need[pos] > 0:
             return True
         if 'FLEX' in self.need and self.need['FLEX'] > 0 and pos in FLEX_SET:
             return True
         return False
 
+    def slot_assignment(self) -> List[Tuple[str, Optional[int]]]:
+        """
+        (slot_name, pick_ix) for each drafted player, in lineup order (slots mode only).
+        pick_ix is None for a player added via add_player() but not yet in `picks`.
+        """
+        if self.slots is None:
+            return []
+        assign = self._match(self.held) or []
+        picks = self.picks + [None] * (len(self.held) - len(self.picks))
+        return [(self._slot_names[s], ix) for s, ix in sorted(zip(assign, picks), key=lambda kv: kv[0])]
+
     def add_player(self, pos: str):
+        if self.slots is not None:
+            self.held.append(_elig(pos))
+            self._legal.clear()
+            # refresh open-slot counts from the current assignment (display only)
+            self.need = dict(self._lineup)
+            for slot, _ in self.slot_assignment():
+                self.need[slot] -= 1
+            return
         if pos in self.need and self.need[pos] > 0:
             self.need[pos] -= 1
         elif 'FLEX' in self.need and self.need['FLEX'] > 0 and pos in FLEX_SET:
@@ -33,9 +104,11 @@ class DraftState:
     current_pick: int = 1
     teams: List[Team] = field(init=False)
     taken: set[int] = field(default_factory=set)
+    lineup: Dict[str,int] = field(default_factory=lambda: dict(LINEUP))
+    slots: Optional[Dict[str,set]] = None   # e.g. BASKETBALL_SLOTS for multi-eligibility leagues
 
     def __post_init__(self):
-        self.teams = [Team() for _ in range(self.n_teams)]
+        self.teams = [Team(need=dict(self.lineup), slots=self.slots) for _ in range(self.n_teams)]
 
     def pick_owner(self, pick_number: int) -> int:
         rnd = math.ceil(pick_number / self.n_teams)
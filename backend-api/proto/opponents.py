@@ -0,0 +1,115 @@
+# opponents.py
+import math
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class OpponentModel:
+    """
+    Per-team pick-behaviour parameters, learned online from observed picks.
+    Everything is a compact per-team array, so observe() is O(1) and params() is O(#positions):
+      eta[t]      : rank sharpness (how closely team t follows the top of the board)
+      mix[t]      : ADP-vs-ESPN mixing, 0 = pure ESPN board, 1 = pure ADP (global_rank)
+      pos_bias(t) : log-ratio of t's positional pick share to the league's (stacking > 0)
+    Each estimate is shrunk toward the shared ESPN model with `prior_n` pseudo-picks, so
+    before a team's first pick its hazards are identical to today's shared softmax.
+
+    eta is fit on pick depths within the picked position on the raw rank scale the hazard uses
+    (board_depths()), i.e. the hazard's within-position conditional, where pos_bias cancels.
+    It is still the closed-form geometric-rate estimate, which assumes dense integer ranks and
+    ignores the top-N window / leaky tail, so it approximates the softmax MLE and does not
+    reproduce the shared model exactly once picks arrive.
+    """
+
+    def __init__(self, n_teams: int, positions: Iterable[str], eta: float = 0.4, prior_n: float = 4.0):
+        self.positions = list(positions)
+        self._pos_ix = {p: i for i, p in enumerate(self.positions)}
+        self.eta0 = float(eta)
+        self.prior_n = float(prior_n)
+
+        # shared-model prior: softmax over ranks with sharpness eta ~ geometric,
+        # so E[depth] = 1 / (1 - exp(-eta))
+        self._ord0 = 1.0 / (1.0 - np.exp(-self.eta0))
+
+        self.n_obs = np.zeros(n_teams)               # all picks (positional shares)
+        self.n_rank = np.zeros(n_teams)              # picks with a usable ESPN depth (eta / mix)
+        self.sum_ord = np.zeros(n_teams)            # Σ pick depth on the mixed board
+        self.sum_w = np.zeros(n_teams)              # Σ informativeness of ESPN-vs-ADP comparisons
+        self.sum_wr = np.zeros(n_teams)             # Σ informativeness * P(ADP explains pick)
+        self.pos_counts = np.zeros((n_teams, len(self.positions)))
+        self.league_pos_counts = np.zeros(len(self.positions))
+
+        self.eta = np.full(n_teams, self.eta0)
+        self.mix = np.zeros(n_teams)
+
+    def observe(self, team_ix: int, pos: str, espn_depth: Optional[float], adp_depth: float) -> None:
+        """
+        Online update for one pick, O(1).
+        espn_depth / adp_depth: 1-based depth of the pick on the CURRENT ESPN / ADP boards
+        (see board_depths()). With espn_depth None only the positional counts are updated.
+        """
+        t = team_ix
+
+        # positional counts (bias derived lazily in pos_bias)
+        self.n_obs[t] += 1
+        k = self._pos_ix.get(pos)
+        if k is not None:
+            self.pos_counts[t, k] += 1
+            self.league_pos_counts[k] += 1
+        if espn_depth is None:
+            return
+
+        eta, mix = self.eta[t], self.mix[t]
+
+        # ADP vs ESPN: which board explains this pick better (logistic responsibility),
+        # weighted by how much the two boards disagree about it
+        r = 1.0 / (1.0 + math.exp(-eta * (espn_depth - adp_depth)))
+        w = abs(2.0 * r - 1.0)
+        self.sum_w[t] += w
+        self.sum_wr[t] += w * r
+        self.mix[t] = self.sum_wr[t] / (self.prior_n + self.sum_w[t])   # prior mix = 0 (ESPN)
+
+        # rank sharpness from the mean depth on the mixed board (geometric-rate estimate)
+        self.n_rank[t] += 1
+        self.sum_ord[t] += (1.0 - mix) * espn_depth + mix * adp_depth
+        m = (self.prior_n * self._ord0 + self.sum_ord[t]) / (self.prior_n + self.n_rank[t])
+        self.eta[t] = min(3.0, max(0.05, math.log(m / (m - 1.0)))) if m > 1.0 else 3.0
+
+    def pos_bias(self, team_ix: int) -> Dict[str, float]:
+        """
+        {pos: log(share_t / share_league)}, with team share shrunk toward the league share.
+        0.0 everywhere until the team has picked.
+        """
+        P = len(self.positions)
+        q = (self.league_pos_counts + 1.0) / (self.league_pos_counts.sum() + P)
+        c = self.pos_counts[team_ix]
+        share = (c + self.prior_n * q) / (self.n_obs[team_ix] + self.prior_n)
+        return dict(zip(self.positions, np.log(share / q).tolist()))
+
+    def params(self, team_ix: int) -> Tuple[float, float, Dict[str, float]]:
+        """(eta, mix, pos_bias) for esbn_pick_probs_for_team."""
+        return float(self.eta[team_ix]), float(self.mix[team_ix]), self.pos_bias(team_ix)
+
+
+def board_depths(df, available_ix: List[int], ix: int, team=None,
+                 espn_col: str = 'espn_rank', adp_col: str = 'global_rank') -> Tuple[Optional[float], float]:
+    """
+    How deep pick `ix` went on the current ESPN and ADP boards, on the raw rank scale the
+    hazard softmax uses: rank(pick) - best rank available at the pick's position, + 1 (1 = top).
+    Measured within the position so positional stacking lands in pos_bias, not eta; with `team`,
+    only players that team could legally draft are counted.
+    ESPN depth is None when the pick has no ESPN rank: the hazard never shows such players,
+    so the pick says nothing about ESPN sharpness or ADP-vs-ESPN mixing.
+    """
+    if espn_col not in df.columns or df[espn_col].isna().all():
+        espn_col = adp_col
+    board = df.loc[available_ix]
+    board = board[board['position'] == df.at[ix, 'position']]
+    if team is not None:
+        keys = board['eligible'] if 'eligible' in board.columns else board['position']
+        board = board[keys.map({k: team.can_draft(k) for k in keys.unique()}).astype(bool)]
+    adp_depth = float(df.at[ix, adp_col] - board[adp_col].min()) + 1.0
+    me_espn = df.at[ix, espn_col]
+    if np.isnan(me_espn):
+        return None, adp_depth
+    return float(me_espn - board[espn_col].min()) + 1.0, adp_depth
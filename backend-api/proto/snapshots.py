@@ -0,0 +1,229 @@
+# snapshots.py
+import os, sys, glob
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+from util import _norm_name
+
+# Append-only columnar store of board snapshots (ADP / ESPN rank / projection per player per timestamp).
+#
+#   <root>/players.csv          id,player_name,position,name_key   (append-only dictionary)
+#   <root>/chunk_000000.npz     one file per append: ts:int64, pid:int32, adp/espn_rank/proj:float32
+#
+# On open, all chunks are concatenated and sorted by (pid, ts) so every player's history is a
+# contiguous slice (CSR-style `_start` offsets); as-of lookups are one vectorized searchsorted.
+
+_TS_BITS = 34          # epoch seconds fit in 34 bits until year 2514
+DAY = 86400
+
+
+def _to_epoch(ts) -> int:
+    if ts is None:
+        return int(pd.Timestamp.now(tz='UTC').timestamp())
+    if isinstance(ts, (int, np.integer)):
+        return int(ts)
+    t = pd.Timestamp(ts)
+    if t.tzinfo is None:
+        t = t.tz_localize('UTC')
+    return int(t.timestamp())
+
+
+def _first_col(df: pd.DataFrame, names) -> np.ndarray:
+    for c in names:
+        if c in df.columns:
+            return pd.to_numeric(df[c], errors='coerce').to_numpy(dtype=np.float32)
+    return np.full(len(df), np.nan, dtype=np.float32)
+
+
+class SnapshotStore:
+    """
+    Usage:
+        store = SnapshotStore("data/snapshots")
+        store.append_csv("data/player_rankings.csv")           # ts from 'last_updated'
+        board = store.board_as_of("2025-08-20")
+        trend = store.adp_trend("2025-08-20", window_days=14)  # adp_velocity < 0 = rising
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._players_path = os.path.join(root, 'players.csv')
+        if os.path.exists(self._players_path):
+            self.players = pd.read_csv(self._players_path)
+        else:
+            self.players = pd.DataFrame(columns=['id','player_name','position','name_key'])
+        self._ids = {(k, p): int(i) for i, k, p in zip(self.players['id'], self.players['name_key'], self.players['position'])}
+
+        chunks = sorted(glob.glob(os.path.join(root, 'chunk_*.npz')))
+        self._n_chunks = len(chunks)
+        cols = {c: [] for c in ('ts','pid','adp','espn_rank','proj')}
+        for path in chunks:
+            with np.load(path) as z:
+                for c in cols:
+                    cols[c].append(z[c])
+        self._set_columns({c: np.concatenate(v) if v else np.empty(0) for c, v in cols.items()})
+
+    # ---------- write path ----------
+
+    def _player_ids(self, names: pd.Series, positions: pd.Series) -> np.ndarray:
+        keys = names.map(_norm_name)
+        positions = positions.astype(str).str.upper()
+        new = []
+        out = np.empty(len(keys), dtype=np.int32)
+        for j, (name, k, p) in enumerate(zip(names, keys, positions)):
+            pid = self._ids.get((k, p))
+            if pid is None:
+                pid = len(self._ids)
+                self._ids[(k, p)] = pid
+                new.append({'id': pid, 'player_name': name, 'position': p, 'name_key': k})
+            out[j] = pid
+        if new:
+            new_df = pd.DataFrame(new)
+            new_df.to_csv(self._players_path, mode='a', header=not os.path.exists(self._players_path), index=False)
+            self.players = pd.concat([self.players, new_df], ignore_index=True)
+        return out
+
+    def append(self, board: pd.DataFrame, ts=None) -> int:
+        """
+        Append one board snapshot. Expects player_name, position and any of
+        adp / espn_rank / projection (ppg, ppr_points_per_game or projected_points).
+        Never rewrites earlier chunks. Returns the epoch-seconds timestamp used.
+        """
+        if ts is None and 'last_updated' in board.columns and board['last_updated'].notna().any():
+            ts = board['last_updated'].dropna().max()
+        t = _to_epoch(ts)
+        cols = {
+            'ts': np.full(len(board), t, dtype=np.int64),
+            'pid': self._player_ids(board['player_name'].astype(str), board['position']),
+            'adp': _first_col(board, ['adp']),
+            'espn_rank': _first_col(board, ['espn_rank', 'rank']),
+            'proj': _first_col(board, ['ppg', 'ppr_points_per_game', 'projected_points']),
+        }
+        np.savez(os.path.join(self.root, f'chunk_{self._n_chunks:06d}.npz'), **cols)
+        self._n_chunks += 1
+        self._set_columns({c: np.concatenate([getattr(self, f'_{c}'), v]) for c, v in cols.items()})
+        return t
+
+    def append_csv(self, csv_path: str, ts=None) -> int:
+        return self.append(pd.read_csv(csv_path), ts=ts)
+
+    def _set_columns(self, cols: dict) -> None:
+        """Sort by (pid, ts) and rebuild the per-player index."""
+        pid = cols['pid'].astype(np.int32)
+        ts = cols['ts'].astype(np.int64)
+        order = np.lexsort((ts, pid))
+        self._pid, self._ts = pid[order], ts[order]
+        self._adp = cols['adp'].astype(np.float32)[order]
+        self._espn_rank = cols['espn_rank'].astype(np.float32)[order]
+        self._proj = cols['proj'].astype(np.float32)[order]
+        self._key = (self._pid.astype(np.int64) << _TS_BITS) | self._ts
+        self._start = np.searchsorted(self._pid, np.arange(len(self._ids) + 1))
+
+    # ---------- read path ----------
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def timestamps(self) -> np.ndarray:
+        return np.unique(self._ts)
+
+    def board_as_of(self, ts=None, max_age_days: Optional[float] = None) -> pd.DataFrame:
+        """
+        Latest snapshot row per player with timestamp <= ts.
+        Players last seen more than `max_age_days` before ts are dropped (e.g. cut from the board).
+        """
+        t = _to_epoch(ts)
+        pids = np.arange(len(self._ids), dtype=np.int64)
+        pos = np.searchsorted(self._key, (pids << _TS_BITS) | t, side='right') - 1
+        ok = pos >= self._start[:-1]
+        if max_age_days is not None:
+            ok &= self._ts[np.maximum(pos, 0)] >= t - max_age_days * DAY
+        pids, pos = pids[ok], pos[ok]
+        info = self.players.set_index('id').loc[pids]
+        return pd.DataFrame({
+            'player_name': info['player_name'].values,
+            'position': info['position'].values,
+            'adp': self._adp[pos],
+            'espn_rank': self._espn_rank[pos],
+            'proj': self._proj[pos],
+            'snapshot_ts': pd.to_datetime(self._ts[pos], unit='s', utc=True),
+        }, index=pd.Index(pids, name='player_id'))
+
+    def adp_history(self, player_name: str, position: str) -> pd.DataFrame:
+        """One player's full snapshot history (a single contiguous slice)."""
+        pid = self._ids.get((_norm_name(player_name), str(position).upper()))
+        if pid is None:
+            return pd.DataFrame(columns=['ts','adp','espn_rank','proj'])
+        s = slice(self._start[pid], self._start[pid + 1])
+        return pd.DataFrame({
+            'ts': pd.to_datetime(self._ts[s], unit='s', utc=True),
+            'adp': self._adp[s], 'espn_rank': self._espn_rank[s], 'proj': self._proj[s],
+        })
+
+    def adp_trend(self, ts=None, window_days: float = 14.0) -> pd.DataFrame:
+        """
+        Per-player ADP trend over (ts - window_days, ts], all players at once:
+          adp_velocity : least-squares slope, ADP per day (negative = rising up the board)
+          adp_change   : last - first ADP in the window
+          n_snapshots  : points in the window (velocity is 0 with fewer than 2)
+        """
+        t = _to_epoch(ts)
+        m = (self._ts <= t) & (self._ts > t - window_days * DAY) & ~np.isnan(self._adp)
+        pid = self._pid[m]
+        x = (self._ts[m] - t) / DAY
+        y = self._adp[m].astype(np.float64)
+        P = len(self._ids)
+
+        n = np.bincount(pid, minlength=P).astype(np.float64)
+        sx, sy = np.bincount(pid, x, P), np.bincount(pid, y, P)
+        sxx, sxy = np.bincount(pid, x * x, P), np.bincount(pid, x * y, P)
+        den = n * sxx - sx * sx
+        vel = np.divide(n * sxy - sx * sy, den, out=np.zeros(P), where=(n >= 2) & (den > 0))
+
+        # rows are (pid, ts)-sorted, so the window's first/last per player are run boundaries
+        idx = np.flatnonzero(m)
+        first = np.full(P, np.nan)
+        last = np.full(P, np.nan)
+        if len(idx):
+            brk = np.flatnonzero(np.diff(pid)) + 1
+            heads, tails = np.r_[0, brk], np.r_[brk - 1, len(pid) - 1]
+            first[pid[heads]] = y[heads]
+            last[pid[tails]] = y[tails]
+
+        return pd.DataFrame({
+            'adp_velocity': vel,
+            'adp_change': last - first,
+            'n_snapshots': n.astype(np.int32),
+        }, index=pd.Index(np.arange(P), name='player_id'))
+
+
+def attach_adp_momentum_inplace(df_players: pd.DataFrame, store: SnapshotStore, as_of=None, window_days: float = 14.0) -> int:
+    """
+    Adds/overwrites df_players['adp_velocity'] (ADP per day; negative = rising) from the store,
+    matched on (normalized name, position). Unmatched players get 0.0 (no momentum).
+    as_of defaults to the newest snapshot (not wall-clock now, which may be past the window).
+    Returns the number of players with a real trend (>= 2 snapshots in the window).
+    """
+    if as_of is None:
+        if not len(store):
+            df_players['adp_velocity'] = 0.0
+            return 0
+        as_of = int(store.timestamps().max())
+    trend = store.adp_trend(as_of, window_days=window_days)
+    keys = zip(df_players['player_name'].map(_norm_name), df_players['position'].astype(str).str.upper())
+    pids = np.array([store._ids.get(k, -1) for k in keys])
+    vel = np.zeros(len(df_players))
+    hit = pids >= 0
+    vel[hit] = trend['adp_velocity'].to_numpy()[pids[hit]]
+    df_players['adp_velocity'] = vel
+    return int((trend['n_snapshots'].to_numpy()[pids[hit]] >= 2).sum())
+
+
+if __name__ == "__main__":
+    # python snapshots.py <store_dir> <rankings.csv> [timestamp]
+    # Append a refresh to the store instead of only overwriting player_rankings.csv.
+    root, csv_path = sys.argv[1], sys.argv[2]
+    store = SnapshotStore(root)
+    t = store.append_csv(csv_path, ts=sys.argv[3] if len(sys.argv) > 3 else None)
+    print(f"[snapshots] appended {csv_path} @ {pd.to_datetime(t, unit='s', utc=True)} — {len(store)} rows, {len(store.players)} players")
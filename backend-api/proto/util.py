@@ -3,6 +3,7 @@ import pandas as pd
 import re
 
 VALID_POS = {"QB","RB","WR","TE"}
+BASKETBALL_POS = {"PG","SG","SF","PF","C"}
 
 def load_players(csv_path: str) -> pd.DataFrame:
     df = pd.read_csv(csv_path)
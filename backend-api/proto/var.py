@@ -74,11 +74,23 @@ def davar_esbn(df, candidate_ix: int,
     return base + alpha * delta_pos - beta * hedge_loss - risk_penalty
 
 
-def league_replacement_indices(n_teams: int, lineup: dict) -> dict:
+def league_replacement_indices(n_teams: int, lineup: dict, slots: dict = None) -> dict:
     """
     Approx league-wide replacement ranks (starters across league + share of FLEX).
     For 12 teams, LINEUP={QB:1,RB:2,WR:2,TE:1,FLEX:1} → RB/WR ~ 28, TE ~ 16, QB ~ 12.
+    With `slots` (slot -> eligible positions, e.g. BASKETBALL_SLOTS) each slot is split
+    evenly across its eligible positions instead: G → PG/SG, F → SF/PF, UTIL → all five.
+    BENCH slots are left out, same as football.
     """
+    if slots is not None:
+        share = {}
+        for slot, n in lineup.items():
+            if slot == 'BENCH':
+                continue
+            elig = slots[slot]
+            for pos in elig:
+                share[pos] = share.get(pos, 0.0) + n / len(elig)
+        return {pos: int(round(n_teams * v)) for pos, v in share.items()}
     flex = int(lineup.get('FLEX', 0))
     flex_share = flex / 3.0  # split FLEX evenly among RB/WR/TE
     return {